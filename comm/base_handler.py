@@ -19,6 +19,7 @@
 
 
 import abc
+import os
 import socket
 import zmq
 
@@ -49,6 +50,7 @@ class BaseHandler(metaclass=abc.ABCMeta):
         self.context = None
         self.socket = None
         self.poller = None
+        self.wakeup_fd = None
 
         self.is_connected = False
 
@@ -84,16 +86,48 @@ class BaseHandler(metaclass=abc.ABCMeta):
         self.disconnect()
         self.connect()
 
+    def register_wakeup_fd(self, fd):
+        """Registers a file descriptor that interrupts the receive poll.
+
+        A byte written to the descriptor, e.g. from a signal handler via
+        signal.set_wakeup_fd, makes recv_string return None right away
+        instead of waiting for the remaining poll timeout (self-pipe trick).
+        """
+
+        self.wakeup_fd = fd
+        self.poller.register(fd, zmq.POLLIN)
+
     def recv_string(self):
 
-        events = dict(self.poller.poll(self.poll_timeout))
+        if self.wakeup_fd is None:
+
+            # zmq.Socket.poll skips building a Poller event dict per call and
+            # returns immediately when a message is already queued, so a loaded
+            # socket is drained at full speed without waiting for the timeout.
+            if not self.socket.poll(self.poll_timeout, zmq.POLLIN):
+                return None
+
+        else:
+
+            events = dict(self.poller.poll(self.poll_timeout))
+
+            if events.get(self.wakeup_fd):
+
+                # Drain the pipe, so the next poll blocks again.
+                try:
+                    os.read(self.wakeup_fd, 256)
+                except BlockingIOError:
+                    pass
+
+                return None
 
-        if events.get(self.socket) == zmq.POLLIN:
+            if events.get(self.socket) != zmq.POLLIN:
+                return None
 
-            message = self.socket.recv_string()
+        message = self.socket.recv_string()
 
-            if message:
-                return message
+        if message:
+            return message
 
         return None
 
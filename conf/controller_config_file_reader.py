@@ -21,7 +21,16 @@
 import configparser
 import os
 
+from types import SimpleNamespace
+
 from conf.config_value_error import ConfigValueError
+from conf.fast_config_parser import FastConfigParser
+
+
+# Parsed config files keyed by (absolute path, mtime in ns, size).
+# A reader re-created for an unchanged file skips the INI parsing
+# and only pays for a stat() and a dict lookup.
+_CACHE = {}
 
 
 class ControllerConfigFileReader:
@@ -31,8 +40,23 @@ class ControllerConfigFileReader:
         if not os.path.isfile(config_file):
             raise IOError(f"The config file does not exist or is not a file: {config_file}")
 
-        config = configparser.ConfigParser()
-        config.read(config_file)
+        file_stat = os.stat(config_file)
+        cache_key = (os.path.abspath(config_file), file_stat.st_mtime_ns, file_stat.st_size)
+
+        cached = _CACHE.get(cache_key)
+
+        if cached is not None:
+
+            self.__dict__.update(cached.__dict__)
+            return
+
+        # The fast parser handles the flat `[section]` + `key = value` layout
+        # used here; fall back to configparser for anything it cannot digest.
+        try:
+            config = FastConfigParser(config_file)
+        except Exception:
+            config = configparser.ConfigParser(interpolation=None)
+            config.read(config_file)
 
         self.pid_file = config.get('control', 'pid_file')
         self.request_retry_wait_duration = config.getint('control', 'request_retry_wait_duration')
@@ -48,7 +72,9 @@ class ControllerConfigFileReader:
 
         self.validate()
 
+        _CACHE[cache_key] = SimpleNamespace(**self.__dict__)
+
     def validate(self):
 
-        if self.worker_count < 1 or self.worker_count > 1000:
+        if not 1 <= self.worker_count <= 1000:
             raise ConfigValueError(f"Not supported worker count detected: {self.worker_count}")
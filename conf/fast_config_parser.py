@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2021 Gabriele Iannetti <g.iannetti@gsi.de>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+import re
+
+from conf.config_value_error import ConfigValueError
+
+
+class FastConfigParser:
+    """Minimal INI parser for the flat `[section]` + `key = value` config files.
+
+    Covers only what the config file readers actually use: plain sections,
+    `=` or `:` separated options, `#` and `;` comments and no interpolation.
+    It is considerably cheaper than configparser on this subset, which matters
+    when a process is restarted frequently under a supervisor.
+    """
+
+    _section_pattern = re.compile(r"^\s*\[([^\]]+)\]\s*$")
+    _option_pattern = re.compile(r"^\s*([^=:#;]+?)\s*[:=]\s*(.*?)\s*$")
+
+    def __init__(self, config_file):
+
+        self._sections = {}
+
+        section = None
+
+        with open(config_file, encoding='UTF-8') as config:
+
+            for line in config:
+
+                line = line.split('#', 1)[0].split(';', 1)[0]
+
+                if not line.strip():
+                    continue
+
+                match = FastConfigParser._section_pattern.match(line)
+
+                if match:
+
+                    section = self._sections.setdefault(match.group(1).strip(), {})
+                    continue
+
+                match = FastConfigParser._option_pattern.match(line)
+
+                if match:
+
+                    if section is None:
+                        raise ConfigValueError(f"Option found outside any section: {line.strip()}")
+
+                    section[match.group(1)] = match.group(2)
+
+                else:
+                    raise ConfigValueError(f"Unparsable config line: {line.strip()}")
+
+    def get(self, section, option):
+
+        try:
+            return self._sections[section][option]
+        except KeyError as err:
+            raise ConfigValueError(f"Missing config option: [{section}] {option}") from err
+
+    def getint(self, section, option):
+        return int(self.get(section, option))
+
+    def getfloat(self, section, option):
+        return float(self.get(section, option))
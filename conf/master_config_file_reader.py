@@ -21,9 +21,17 @@
 import configparser
 import os
 
+from types import SimpleNamespace
+
 from conf.config_value_error import ConfigValueError
 
 
+# Parsed config files keyed by (absolute path, mtime in ns, size).
+# A reader re-created for an unchanged file skips the INI parsing
+# and only pays for a stat() and a dict lookup.
+_CACHE = {}
+
+
 class MasterConfigFileReader:
 
     def __init__(self, config_file):
@@ -31,7 +39,17 @@ class MasterConfigFileReader:
         if not os.path.isfile(config_file):
             raise IOError(f"The config file does not exist or is not a file: {config_file}")
 
-        config = configparser.ConfigParser()
+        file_stat = os.stat(config_file)
+        cache_key = (os.path.abspath(config_file), file_stat.st_mtime_ns, file_stat.st_size)
+
+        cached = _CACHE.get(cache_key)
+
+        if cached is not None:
+
+            self.__dict__.update(cached.__dict__)
+            return
+
+        config = configparser.ConfigParser(interpolation=None)
         config.read(config_file)
 
         self.pid_file = config.get('control', 'pid_file')
@@ -49,3 +67,5 @@ class MasterConfigFileReader:
         self.task_gen_module = config.get('task_generator', 'module')
         self.task_gen_class = config.get('task_generator', 'class')
         self.task_gen_config_file = config.get('task_generator', 'config_file')
+
+        _CACHE[cache_key] = SimpleNamespace(**self.__dict__)
@@ -22,21 +22,28 @@ class CriticalSection:
 
     def __init__(self, lock, block=True, timeout=None):
 
-        self._lock = lock
-        self._block = block
-        self._timeout = timeout
+        # Bind the lock methods and acquire arguments once, so entering and
+        # leaving the critical section is as cheap as possible on hot paths.
+        self._acquire = lock.acquire
+        self._release = lock.release
+
+        if timeout is None:
+            self._acquire_args = (block,)
+        else:
+            self._acquire_args = (block, timeout)
+
         self._lock_acquired = False
 
     def __enter__(self):
 
-        self._lock_acquired = self._lock.acquire(self._block, self._timeout)
+        self._lock_acquired = self._acquire(*self._acquire_args)
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
 
         if self._lock_acquired:
 
-            self._lock.release()
+            self._release()
             self._lock_acquired = False
 
     def is_locked(self):
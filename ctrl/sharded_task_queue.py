@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2021 Gabriele Iannetti <g.iannetti@gsi.de>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""Module for the sharded task queue"""
+
+import multiprocessing
+
+from ctrl.shared_queue import SharedQueue
+
+
+class ShardedTaskQueue:
+    """Task queue split into multiple SharedQueue shards.
+
+    Producers spread their pushes round-robin across the shards, while a
+    consumer pops from the shard its name hashes to and steals from the
+    neighbour shards when its own shard runs empty. Distinct consumers
+    therefore contend on distinct shard locks instead of serializing on
+    a single queue lock.
+
+    The global lock property serializes the clear() plus fill() sequences
+    of the task generators against each other. Consumers do not take it:
+    pop_nowait_for() stays lock-free, which clear() tolerates by draining
+    with non-blocking gets, so a consumer stealing the last item cannot
+    leave a generator blocked inside a clear.
+    """
+
+    def __init__(self, shard_count=4):
+
+        if shard_count < 1:
+            raise RuntimeError(f"Invalid shard count detected: {shard_count}")
+
+        self._shards = [SharedQueue() for _ in range(shard_count)]
+        self._shard_count = shard_count
+        self._push_index = 0
+        self._lock = multiprocessing.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+
+        for shard in self._shards:
+            shard.__exit__(exc_type, exc_value, traceback)
+
+    def fill(self, in_list):
+        """Distributes the passed input list round-robin across the shards."""
+
+        if len(in_list) == 0:
+            raise RuntimeError('Input list is empty!')
+
+        if not self.is_empty():
+            raise RuntimeError('Sharded Task Queue is not empty!')
+
+        for i, item in enumerate(in_list):
+            self._shards[i % self._shard_count].push(item)
+
+    def clear(self):
+        """Clears all items from all shards (partly blocking)."""
+
+        for shard in self._shards:
+            shard.clear()
+
+    def push(self, item):
+        """Pushes an item onto the next shard in round-robin order."""
+
+        self._shards[self._push_index].push(item)
+        self._push_index = (self._push_index + 1) % self._shard_count
+
+    def pop_nowait_for(self, consumer_name):
+        """Pops an item for the given consumer (non-blocking, lock-free).
+
+        The consumer name is hashed to its home shard first; empty shards
+        are skipped in favour of stealing from the next neighbour.
+        The underlying multiprocessing.Queue already serializes single
+        get accesses, so neither the shard locks nor the global lock are
+        taken on this path; a pop racing a generator's clear() plus
+        fill() may return an item of either the old or the new cycle.
+
+        Returns
+        -------
+        object
+            on success an object retrieved from a shard is returned,
+            otherwise None is returned.
+        """
+
+        start_index = hash(consumer_name) % self._shard_count
+
+        for i in range(self._shard_count):
+
+            item = self._shards[(start_index + i) % self._shard_count].pop_nowait()
+
+            if item is not None:
+                return item
+
+        return None
+
+    def is_empty(self):
+        """Checks if all shards are empty (non-blocking).
+
+        Because of multiprocessing semantics, this is not reliable.
+        Use a locking mechanism to guarantee consistency.
+        """
+
+        for shard in self._shards:
+
+            if not shard.is_empty():
+                return False
+
+        return True
+
+    @property
+    def lock(self):
+        """Returns the global lock serializing the generators' multi-shard operations."""
+        return self._lock
@@ -92,16 +92,21 @@ class SharedQueue:
             self._queue.put(item)
 
     def clear(self):
-        """Clears all items from the queue (partly blocking).
+        """Clears all items from the queue (non-blocking).
 
-        Since the items in the queue have to be iterated over, just each remove
-        of an item is blocking. But the iteration does not guarantee full consistency.
-        Because of multiprocessing semantics, this is not reliable.
-        Use a locking mechanism to guarantee consistency.
+        The drain uses non-blocking gets, so a concurrent consumer that
+        steals the last item between two removes cannot leave the clear
+        blocked in a get forever. The iteration does not guarantee full
+        consistency: because of multiprocessing semantics, items still in
+        flight in the feeder thread may survive a clear.
         """
 
-        while not self._queue.empty():
-            self._queue.get()
+        while True:
+
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                return
 
     def push(self, item):
         """Pushes an item into the queue (blocking).
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2021 Gabriele Iannetti <g.iannetti@gsi.de>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""Module for the SPMC ring buffer"""
+
+import multiprocessing
+import time
+
+from ctrl.spsc_ring_buffer import SPSCRingBuffer
+
+
+class SPMCRingBuffer(SPSCRingBuffer):
+    """Ring buffer variant with a single producer and multiple consumers.
+
+    Pushing stays lock-free, since there is exactly one producer.
+    Concurrent pops are serialized by one consumer-side lock, which still
+    avoids the pipe, the feeder thread and the pickling a
+    multiprocessing.Queue pays per item: slots carry fixed-size string
+    descriptors that live directly in shared memory.
+    """
+
+    # The default slot size covers a worst-case task descriptor: a
+    # migration message embeds an arbitrary Lustre file path, which may
+    # approach PATH_MAX (4096) on top of the message header.
+    def __init__(self, capacity=1024, slot_size=8192):
+
+        super().__init__(capacity, slot_size)
+
+        self._pop_lock = multiprocessing.Lock()
+
+    def pop_nowait(self):
+
+        with self._pop_lock:
+            return super().pop_nowait()
+
+    def pop(self):
+        """Returns an item from the ring, yielding while it is empty (blocking)."""
+
+        while True:
+
+            item = self.pop_nowait()
+
+            if item is not None:
+                return item
+
+            time.sleep(0.001)
+
+    def pop_batch(self, max_count):
+        """Returns up to max_count items from the ring (blocking for the first).
+
+        Returns
+        -------
+        list
+            a list with at least one and up to max_count items.
+        """
+
+        if max_count < 1:
+            raise RuntimeError(f"Invalid batch size detected: {max_count}")
+
+        items = [self.pop()]
+
+        while len(items) < max_count:
+
+            item = self.pop_nowait()
+
+            if item is None:
+                break
+
+            items.append(item)
+
+        return items
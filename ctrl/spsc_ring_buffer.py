@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2021 Gabriele Iannetti <g.iannetti@gsi.de>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""Module for the lock-free SPSC ring buffer"""
+
+import ctypes
+import multiprocessing
+import time
+
+
+class SPSCRingBuffer:
+    """Lock-free single-producer single-consumer ring buffer in shared memory.
+
+    A classic Lamport queue for fixed-size string items: the producer only
+    advances the head counter and the consumer only advances the tail
+    counter, so word-sized counter stores make push and pop safe between
+    exactly one producer and one consumer process without any lock.
+
+    The payload is written before the head counter is advanced, so the
+    consumer never observes a slot before it is complete.
+    """
+
+    def __init__(self, capacity=1024, slot_size=64):
+
+        if capacity < 1:
+            raise RuntimeError(f"Invalid ring buffer capacity detected: {capacity}")
+
+        if slot_size < 1:
+            raise RuntimeError(f"Invalid ring buffer slot size detected: {slot_size}")
+
+        self._capacity = capacity
+        self._slot_size = slot_size
+
+        self._buffer = multiprocessing.RawArray(ctypes.c_char, capacity * slot_size)
+
+        # Monotonically increasing counters; (head - tail) is the fill level.
+        self._head = multiprocessing.RawValue(ctypes.c_uint64, 0)
+        self._tail = multiprocessing.RawValue(ctypes.c_uint64, 0)
+
+    def try_push(self, item):
+        """Pushes an item into the ring (non-blocking, producer only).
+
+        Returns True on success, False if the ring is full.
+        """
+
+        if not item:
+            raise RuntimeError("Passed item for ring buffer push was not set!")
+
+        head = self._head.value
+
+        if head - self._tail.value == self._capacity:
+            return False
+
+        data = item.encode()
+
+        if len(data) > self._slot_size:
+            raise RuntimeError(f"Item exceeds ring buffer slot size: {item}")
+
+        start = (head % self._capacity) * self._slot_size
+        self._buffer[start:start + self._slot_size] = data.ljust(self._slot_size, b'\0')
+
+        self._head.value = head + 1
+
+        return True
+
+    def push(self, item):
+        """Pushes an item into the ring, yielding while the ring is full."""
+
+        while not self.try_push(item):
+            time.sleep(0.001)
+
+    def push_batch(self, in_list):
+        """Pushes all items of the passed input list into the ring."""
+
+        if not in_list:
+            raise RuntimeError('Input list for ring buffer push was empty!')
+
+        for item in in_list:
+            self.push(item)
+
+    def pop_nowait(self):
+        """Returns an item from the ring (non-blocking, consumer only).
+
+        Returns
+        -------
+        str
+            on success an item retrieved from the ring is returned,
+            otherwise None is returned.
+        """
+
+        tail = self._tail.value
+
+        if self._head.value == tail:
+            return None
+
+        start = (tail % self._capacity) * self._slot_size
+        data = self._buffer[start:start + self._slot_size]
+
+        self._tail.value = tail + 1
+
+        return data.rstrip(b'\0').decode()
+
+    def is_empty(self):
+        """Checks if the ring is empty (non-blocking)."""
+        return self._head.value == self._tail.value
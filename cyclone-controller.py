@@ -19,12 +19,15 @@
 
 
 import argparse
+import ctypes
 import logging
 import multiprocessing
 import os
+import select
 import signal
 import sys
 import time
+import zlib
 
 from worker import Worker
 from worker import WorkerState
@@ -32,10 +35,12 @@ from worker import WorkerStateTableItem
 from comm.controller_handler import ControllerCommHandler
 from conf.controller_config_file_reader import ControllerConfigFileReader
 from ctrl.pid_control import PIDControl
-from ctrl.critical_section import CriticalSection
-from ctrl.shared_queue import SharedQueue
+from ctrl.spmc_ring_buffer import SPMCRingBuffer
+from ctrl.spsc_ring_buffer import SPSCRingBuffer
+from msg.base_message import BaseMessage
 from msg.message_factory import MessageFactory
 from msg.message_type import MessageType
+from msg.task_assign import TaskAssign
 from msg.task_finished import TaskFinished
 from msg.task_request import TaskRequest
 from msg.heartbeat import Heartbeat
@@ -106,8 +111,12 @@ def create_worker_state_table(worker_ids):
     worker_state_table = dict()
     len_worker_ids = len(worker_ids)
 
+    # All items share one contiguous array of cache-line padded slots,
+    # so concurrent state writes of distinct workers never false share.
+    worker_state_table_items = WorkerStateTableItem.create_table_items(len_worker_ids)
+
     for i in range(0, len_worker_ids):
-        worker_state_table[worker_ids[i]] = WorkerStateTableItem()
+        worker_state_table[worker_ids[i]] = worker_state_table_items[i]
 
     len_worker_state_table = len(worker_state_table)
 
@@ -119,10 +128,10 @@ def create_worker_state_table(worker_ids):
 
 
 def create_worker(worker_state_table,
-                  lock_worker_state_table,
                   task_queue,
-                  result_queue,
-                  cond_result_queue):
+                  result_ring_dict,
+                  result_wakeup_fd,
+                  worker_run_flag):
 
     worker_handle_dict = dict()
 
@@ -133,16 +142,26 @@ def create_worker(worker_state_table,
         worker_handle = \
             Worker(worker_id,
                    worker_state_table_item,
-                   lock_worker_state_table,
                    task_queue,
-                   result_queue,
-                   cond_result_queue)
+                   result_ring_dict[worker_id],
+                   result_wakeup_fd,
+                   worker_run_flag)
 
         worker_handle_dict[worker_id] = worker_handle
 
     return worker_handle_dict
 
 
+def check_all_result_rings_empty(result_ring_list):
+
+    for result_ring in result_ring_list:
+
+        if not result_ring.is_empty():
+            return False
+
+    return True
+
+
 def start_worker(worker_handle_dict, worker_state_table):
 
     if not worker_handle_dict:
@@ -224,9 +243,7 @@ def main():
         with PIDControl(config_file_reader.pid_file) as pid_control, \
                 ControllerCommHandler(config_file_reader.comm_target,
                                       config_file_reader.comm_port,
-                                      config_file_reader.poll_timeout) as comm_handler, \
-                SharedQueue() as result_queue, \
-                SharedQueue() as task_queue:
+                                      config_file_reader.poll_timeout) as comm_handler:
 
             if pid_control.lock():
 
@@ -249,21 +266,49 @@ def main():
                 request_retry_wait_duration = config_file_reader.request_retry_wait_duration
                 max_num_request_retries = config_file_reader.max_num_request_retries
 
-                lock_worker_state_table = multiprocessing.Lock()
-                lock_result_queue = multiprocessing.Lock()
-
-                cond_result_queue = multiprocessing.Condition(lock_result_queue)
+                # Workers announce new results with a single pipe write and
+                # this process sleeps in select on the read end, so the
+                # worker hot path carries no result lock or condition
+                # variable. Both ends are non-blocking: a full pipe already
+                # holds pending wakeups.
+                result_wakeup_read, result_wakeup_write = os.pipe()
+                os.set_blocking(result_wakeup_read, False)
+                os.set_blocking(result_wakeup_write, False)
+
+                # Shared run flag for all worker; one store stops every
+                # worker loop without signal delivery.
+                worker_run_flag = multiprocessing.RawValue(ctypes.c_int, 1)
+
+                # Tasks travel as their serialized TASK_ASSIGN strings in a
+                # shared memory ring: one producer (this process), the
+                # workers pop under a single consumer-side lock and no item
+                # is ever pickled.
+                task_queue = SPMCRingBuffer()
 
                 worker_count = config_file_reader.worker_count
                 worker_ids = create_worker_ids(worker_count)
                 worker_state_table = create_worker_state_table(worker_ids)
 
+                # One lock-free SPSC ring per worker carries the finished
+                # tids, so result pushes of distinct workers never contend.
+                result_ring_dict = dict()
+
+                for worker_id in worker_ids:
+                    result_ring_dict[worker_id] = SPSCRingBuffer()
+
+                result_ring_list = list(result_ring_dict.values())
+
                 worker_handle_dict = \
                     create_worker(worker_state_table,
-                                  lock_worker_state_table,
                                   task_queue,
-                                  result_queue,
-                                  cond_result_queue)
+                                  result_ring_dict,
+                                  result_wakeup_write,
+                                  worker_run_flag)
+
+                # Workers publish the tid in execution as a CRC32 handle with
+                # one word store; this table resolves a handle back to the
+                # tid string and only holds tasks in flight.
+                tid_handle_table = dict()
 
                 global RUN_CONDITION
 
@@ -280,30 +325,34 @@ def main():
 
                         if not send_msg:
 
-                            with CriticalSection(cond_result_queue):
-
-                                if not result_queue.is_empty():
+                            # Ring pops are lock-free, so no critical
+                            # section is needed to collect a result.
+                            for result_ring in result_ring_list:
 
-                                    task_id = result_queue.pop_nowait()
+                                task_id = result_ring.pop_nowait()
 
-                                    if task_id:
+                                if task_id:
 
-                                        logging.debug("Finished task: %s", task_id)
-                                        send_msg = TaskFinished(comm_handler.fqdn, task_id)
+                                    logging.debug("Finished task: %s", task_id)
+                                    tid_handle_table.pop(zlib.crc32(task_id.encode()), None)
+                                    send_msg = TaskFinished(comm_handler.fqdn, task_id)
+                                    break
 
                         if not send_msg:
 
                             found_ready_worker = False
 
-                            with CriticalSection(lock_worker_state_table):
-
-                                for worker_id in worker_state_table.keys():
+                            # Each state word is written only by its owning
+                            # worker with one atomic store; a stale snapshot
+                            # is re-read on the next polling round, so the
+                            # scan needs no lock.
+                            for worker_id in worker_state_table.keys():
 
-                                    if worker_handle_dict[worker_id].is_alive() \
-                                            and worker_state_table[worker_id].get_state == WorkerState.READY:
+                                if worker_handle_dict[worker_id].is_alive() \
+                                        and worker_state_table[worker_id].get_state == WorkerState.READY:
 
-                                        found_ready_worker = True
-                                        break
+                                    found_ready_worker = True
+                                    break
 
                             if found_ready_worker:
 
@@ -328,14 +377,20 @@ def main():
 
                                 else:   # Available worker are busy
 
-                                    with CriticalSection(cond_result_queue):
+                                    wait_timeout_result_queue = 1
+
+                                    readable, _, _ = \
+                                        select.select([result_wakeup_read], [], [], wait_timeout_result_queue)
 
-                                        wait_timeout_result_queue = 1
+                                    if readable:
 
-                                        cond_result_queue.wait(wait_timeout_result_queue)
+                                        try:
+                                            os.read(result_wakeup_read, 256)
+                                        except BlockingIOError:
+                                            pass
 
-                                        if result_queue.is_empty():
-                                            send_msg = Heartbeat(comm_handler.fqdn)
+                                    if check_all_result_rings_empty(result_ring_list):
+                                        send_msg = Heartbeat(comm_handler.fqdn)
 
                         if send_msg:
 
@@ -359,10 +414,23 @@ def main():
 
                                 if MessageType.TASK_ASSIGN() == in_msg_type:
 
-                                    task = in_msg.to_task()
-                                    logging.debug("Retrieved task assign for: %s", task.tid)
-                                    task_queue.push(task)
-                                    logging.debug("Pushed task to task queue: %s", task.tid)
+                                    tid = in_raw_data.split(BaseMessage.field_separator, 4)[3]
+                                    tid_handle_table[zlib.crc32(tid.encode())] = tid
+
+                                    # The raw message is pushed as-is; the worker
+                                    # deserializes it when popping the descriptor.
+                                    # A descriptor exceeding the ring slot size is
+                                    # dropped instead of terminating the controller.
+                                    # Only monitoring tasks are re-created every
+                                    # interval and thus self-heal; a dropped
+                                    # benchmark or migration task is not resent,
+                                    # so the error logged below is the only trace
+                                    # of the stalled task.
+                                    try:
+                                        task_queue.push(in_raw_data)
+                                        logging.debug("Pushed task descriptor to task queue.")
+                                    except RuntimeError as err:
+                                        logging.error("Dropped task descriptor of task: %s - %s", tid, err)
 
                                 elif MessageType.ACKNOWLEDGE() == in_msg_type:
                                     pass
@@ -407,10 +475,23 @@ def main():
 
                                     if MessageType.TASK_ASSIGN() == in_msg_type:
 
-                                        task = in_msg.to_task()
-                                        logging.debug("Retrieved task assign for: %s", task.tid)
-                                        task_queue.push(task)
-                                        logging.debug("Pushed task to task queue: %s", task.tid)
+                                        tid = in_raw_data.split(BaseMessage.field_separator, 4)[3]
+                                        tid_handle_table[zlib.crc32(tid.encode())] = tid
+
+                                        # The raw message is pushed as-is; the worker
+                                        # deserializes it when popping the descriptor.
+                                        # A descriptor exceeding the ring slot size is
+                                        # dropped instead of terminating the controller.
+                                        # Only monitoring tasks are re-created every
+                                        # interval and thus self-heal; a dropped
+                                        # benchmark or migration task is not resent,
+                                        # so the error logged below is the only trace
+                                        # of the stalled task.
+                                        try:
+                                            task_queue.push(in_raw_data)
+                                            logging.debug("Pushed task descriptor to task queue.")
+                                        except RuntimeError as err:
+                                            logging.error("Dropped task descriptor of task: %s - %s", tid, err)
 
                                     elif MessageType.ACKNOWLEDGE() == in_msg_type:
                                         pass
@@ -451,6 +532,10 @@ def main():
 
                         logging.info("Shutting down all worker...")
 
+                        # One store stops all worker loops; poison pills
+                        # unblock workers waiting in a blocking pop.
+                        worker_run_flag.value = 0
+
                         all_worker_down = False
 
                         while not all_worker_down:
@@ -461,9 +546,7 @@ def main():
 
                                 if worker_handle_dict[worker_id].is_alive():
 
-                                    os.kill(worker_handle_dict[worker_id].pid, signal.SIGUSR1)
-
-                                    task_queue.push(PoisenPill())
+                                    task_queue.push(TaskAssign(PoisenPill()).to_string())
 
                                     logging.debug("Waiting for worker to complete: %s",
                                                   worker_handle_dict[worker_id].name)
@@ -19,8 +19,10 @@
 
 
 import argparse
+import heapq
 import importlib
 import logging
+import logging.handlers
 import os
 import signal
 import sys
@@ -32,7 +34,7 @@ from ctrl.task_status_item import TaskState
 from ctrl.task_status_item import TaskStatusItem
 from ctrl.pid_control import PIDControl
 from ctrl.shared_queue import SharedQueue
-from ctrl.critical_section import CriticalSection
+from ctrl.sharded_task_queue import ShardedTaskQueue
 from msg.exit_command import ExitCommand
 from msg.message_factory import MessageFactory
 from msg.message_type import MessageType
@@ -46,6 +48,22 @@ from version.minimal_python import MinimalPython
 TASK_DISTRIBUTION = True
 
 
+try:
+
+    _CLOCK_COARSE = time.CLOCK_REALTIME_COARSE
+
+    def _coarse_time():
+        """Seconds since the epoch from the coarse realtime clock.
+
+        Jiffy resolution is enough for heartbeats and timeouts and the
+        coarse clock is considerably cheaper to read than CLOCK_REALTIME.
+        """
+        return time.clock_gettime(_CLOCK_COARSE)
+
+except AttributeError:
+    _coarse_time = time.time
+
+
 def init_arg_parser():
 
     default_config_file = "/etc/cyclone/master.conf"
@@ -85,7 +103,22 @@ def init_logging(log_filename, enable_debug):
         log_level = logging.INFO
 
     if log_filename:
-        logging.basicConfig(filename=log_filename, level=log_level, format="%(asctime)s - %(levelname)s: %(message)s")
+
+        # Buffer log records in memory, so debug lines do not cost one
+        # write() syscall each. Records of level INFO and above flush the
+        # buffer immediately, since the sparse operational lines (startup,
+        # PID, shutdown progress) must reach the file right away; only the
+        # high-volume debug lines are batched, in groups of 1024 records
+        # and on logging.shutdown().
+        file_handler = logging.FileHandler(log_filename)
+        file_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s: %(message)s"))
+
+        memory_handler = logging.handlers.MemoryHandler(capacity=1024,
+                                                        flushLevel=logging.INFO,
+                                                        target=file_handler)
+
+        logging.basicConfig(level=log_level, handlers=[memory_handler])
+
     else:
         logging.basicConfig(level=log_level, format="%(asctime)s - %(levelname)s: %(message)s")
 
@@ -117,6 +150,17 @@ def signal_handler(signum, frame):
         stop_task_distribution()
 
 
+def send_message(comm_handler, send_msg, debug_enabled):
+    """Serializes the message once and sends it, logging the same string."""
+
+    msg_string = send_msg.to_string()
+
+    if debug_enabled:
+        logging.debug("Sending message: %s", msg_string)
+
+    comm_handler.send_string(msg_string)
+
+
 def check_all_controller_down(count_active_controller):
 
     if not count_active_controller:
@@ -165,7 +209,7 @@ def main():
                 MasterCommHandler(config_file_reader.comm_target,
                                   config_file_reader.comm_port,
                                   config_file_reader.poll_timeout) as comm_handler, \
-                SharedQueue() as task_queue, \
+                ShardedTaskQueue() as task_queue, \
                 SharedQueue() as result_queue:
 
             if pid_control.lock():
@@ -184,9 +228,24 @@ def main():
 
                 comm_handler.connect()
 
+                # Self-pipe: a signal delivered while the master is blocked
+                # in the ZMQ poll writes a byte here, so shutdown requests
+                # are observed immediately instead of after the remaining
+                # poll timeout.
+                wakeup_pipe_read, wakeup_pipe_write = os.pipe()
+                os.set_blocking(wakeup_pipe_read, False)
+                os.set_blocking(wakeup_pipe_write, False)
+
+                signal.set_wakeup_fd(wakeup_pipe_write)
+                comm_handler.register_wakeup_fd(wakeup_pipe_read)
+
                 controller_heartbeat_dict = dict()
                 task_status_dict = dict()
 
+                # Heap of (expiry timestamp, controller) entries; stale
+                # entries superseded by newer heartbeats are dropped lazily.
+                controller_expiry_heap = list()
+
                 controller_timeout = config_file_reader.controller_timeout
                 controller_wait_duration = config_file_reader.controller_wait_duration
                 task_resend_timeout = config_file_reader.task_resend_timeout
@@ -197,13 +256,60 @@ def main():
                 # TODO: Make a class for the master.
                 global TASK_DISTRIBUTION
 
+                # The log level does not change at runtime, so evaluate the
+                # debug guard once instead of per message. This also skips
+                # the eager send_msg.to_string() when debug is off.
+                debug_enabled = logging.root.isEnabledFor(logging.DEBUG)
+
+                # Hoist the constant message types and task states, so the
+                # dispatch below compares locals instead of calling a method
+                # per message.
+                msg_task_request = MessageType.TASK_REQUEST()
+                msg_task_finished = MessageType.TASK_FINISHED()
+                msg_heartbeat = MessageType.HEARTBEAT()
+
+                task_state_assigned = TaskState.assigned()
+                task_state_finished = TaskState.finished()
+
                 run_flag = True
 
                 while run_flag:
 
                     try:
 
-                        last_exec_timestamp = int(time.time())
+                        # One clock read per iteration keeps all timestamps
+                        # within an iteration consistent and saves three
+                        # further clock reads on the hot path.
+                        now = int(_coarse_time())
+                        last_exec_timestamp = now
+
+                        # Drain expired entries from the heap front on every
+                        # iteration, in O(expired) instead of a scan: each
+                        # received message pushes one entry, so under
+                        # sustained traffic without poll timeouts the heap
+                        # would otherwise grow one tuple per message. When
+                        # nothing expired, the peek is one comparison.
+                        while controller_expiry_heap and controller_expiry_heap[0][0] <= last_exec_timestamp:
+
+                            _, controller_name = heapq.heappop(controller_expiry_heap)
+
+                            heartbeat = controller_heartbeat_dict.get(controller_name)
+
+                            # Skip stale heap entries of controllers that
+                            # sent a newer heartbeat or already left.
+                            if heartbeat is not None \
+                                    and last_exec_timestamp >= (heartbeat + controller_timeout):
+
+                                if TASK_DISTRIBUTION:
+
+                                    # Keep one live entry per silent
+                                    # controller, so the drain still
+                                    # evicts it once shutdown begins.
+                                    heapq.heappush(controller_expiry_heap,
+                                                   (last_exec_timestamp + controller_timeout, controller_name))
+
+                                else:
+                                    controller_heartbeat_dict.pop(controller_name, None)
 
                         recv_data = comm_handler.recv_string()
 
@@ -211,52 +317,50 @@ def main():
 
                         if recv_data:
 
-                            logging.debug("Retrieved message: %s", recv_data)
+                            if debug_enabled:
+                                logging.debug("Retrieved message: %s", recv_data)
 
                             recv_msg = MessageFactory.create(recv_data)
                             recv_msg_type = recv_msg.type()
 
                             # TODO: Caution, sender is not set everywhere!
-                            controller_heartbeat_dict[recv_msg.sender] = int(time.time())
+                            controller_heartbeat_dict[recv_msg.sender] = now
+                            heapq.heappush(controller_expiry_heap, (now + controller_timeout, recv_msg.sender))
 
                             if TASK_DISTRIBUTION:
 
-                                if recv_msg_type == MessageType.TASK_REQUEST():
-
-                                    task = None
+                                if recv_msg_type == msg_task_request:
 
-                                    with CriticalSection(task_queue.lock, timeout=1) as critical_section:
+                                    # A single pop needs no queue lock: the underlying
+                                    # multiprocessing.Queue handles concurrent accesses
+                                    # and the empty case is signalled by None.
+                                    task = task_queue.pop_nowait_for(recv_msg.sender)
 
-                                        if critical_section.is_locked():
+                                    if task is None and not task_generator.is_alive():
 
-                                            if not task_queue.is_empty():
-                                                task = task_queue.pop_nowait()
-
-                                            else:
+                                        TASK_DISTRIBUTION = False
+                                        controller_wait_duration = 0
 
-                                                if not task_generator.is_alive():
-
-                                                    TASK_DISTRIBUTION = False
-                                                    controller_wait_duration = 0
-
-                                                    # Allow a TaskGenerator to quit itself without notifying the master.
-                                                    logging.info("Task Generator is not alive.")
+                                        # Allow a TaskGenerator to quit itself without notifying the master.
+                                        logging.info("Task Generator is not alive.")
 
                                     if task:
 
                                         do_task_assign = False
 
-                                        if task.tid in task_status_dict:
+                                        task_status = task_status_dict.get(task.tid)
+
+                                        if task_status is not None:
 
                                             task_resend_threshold = \
-                                                (task_status_dict[task.tid].timestamp + task_resend_timeout)
+                                                (task_status.timestamp + task_resend_timeout)
 
-                                            if task_status_dict[task.tid].state == TaskState.finished() \
+                                            if task_status.state == task_state_finished \
                                                     or last_exec_timestamp >= task_resend_threshold:
 
                                                 do_task_assign = True
 
-                                            elif task_status_dict[task.tid].state == TaskState.assigned() \
+                                            elif task_status.state == task_state_assigned \
                                                     and last_exec_timestamp < task_resend_threshold:
 
                                                 logging.debug("Ignoring task to assign..."
@@ -275,29 +379,30 @@ def main():
 
                                             task_status_dict[task.tid] = \
                                                 TaskStatusItem(task.tid,
-                                                               TaskState.assigned(),
+                                                               task_state_assigned,
                                                                recv_msg.sender,
-                                                               int(time.time()))
+                                                               now)
 
                                             send_msg = TaskAssign(task)
 
                                     else:
                                         send_msg = WaitCommand(controller_wait_duration)
 
-                                    logging.debug("Sending message: %s", send_msg.to_string())
-                                    comm_handler.send_string(send_msg.to_string())
+                                    send_message(comm_handler, send_msg, debug_enabled)
 
-                                elif recv_msg_type == MessageType.TASK_FINISHED():
+                                elif recv_msg_type == msg_task_finished:
 
                                     tid = recv_msg.tid
 
-                                    if tid in task_status_dict:
+                                    task_status = task_status_dict.get(tid)
 
-                                        if recv_msg.sender == task_status_dict[tid].controller:
+                                    if task_status is not None:
+
+                                        if recv_msg.sender == task_status.controller:
 
                                             logging.debug("Retrieved finished message for TID: %s", tid)
-                                            task_status_dict[tid].state = TaskState.finished()
-                                            task_status_dict[tid].timestamp = int(time.time())
+                                            task_status.state = task_state_finished
+                                            task_status.timestamp = now
 
                                             logging.debug("Pushing TID to result queue: %s", tid)
                                             result_queue.push(tid)
@@ -310,19 +415,13 @@ def main():
 
                                     send_msg = Acknowledge()
 
-                                    if logging.root.isEnabledFor(logging.DEBUG):
-                                        logging.debug("Sending message: %s", send_msg.to_string())
-
-                                    comm_handler.send_string(send_msg.to_string())
+                                    send_message(comm_handler, send_msg, debug_enabled)
 
-                                elif recv_msg_type == MessageType.HEARTBEAT():
+                                elif recv_msg_type == msg_heartbeat:
 
                                     send_msg = Acknowledge()
 
-                                    if logging.root.isEnabledFor(logging.DEBUG):
-                                        logging.debug("Sending message: %s", send_msg.to_string())
-
-                                    comm_handler.send_string(send_msg.to_string())
+                                    send_message(comm_handler, send_msg, debug_enabled)
 
                                 else:
                                     raise RuntimeError(f"Undefined type found in message: {recv_msg.to_string()}")
@@ -331,10 +430,7 @@ def main():
 
                                 send_msg = ExitCommand()
 
-                                if logging.root.isEnabledFor(logging.DEBUG):
-                                    logging.debug("Sending message: %s", send_msg.to_string())
-
-                                comm_handler.send_string(send_msg.to_string())  # Does not block.
+                                send_message(comm_handler, send_msg, debug_enabled)  # Does not block.
 
                                 controller_heartbeat_dict.pop(recv_msg.sender, None)
 
@@ -346,16 +442,10 @@ def main():
                             logging.debug('RECV-MSG TIMEOUT')
 
                             # This gives controllers the last chance to quit themselves until a timeout is reached.
+                            # The expiry heap drain at the loop head has
+                            # already evicted timed-out controllers.
                             if not TASK_DISTRIBUTION:
 
-                                for controller_name in controller_heartbeat_dict.keys():
-
-                                    controller_threshold = \
-                                        controller_heartbeat_dict[controller_name] + controller_timeout
-
-                                    if last_exec_timestamp >= controller_threshold:
-                                        controller_heartbeat_dict.pop(controller_name, None)
-
                                 if check_all_controller_down(len(controller_heartbeat_dict)):
                                     run_flag = False
 
@@ -124,14 +124,15 @@ class LFSUtils:
         raise RuntimeError(f"[LFSUtils::is_ost_idx_active] Index not found: {ost_idx}")
 
     def set_stripe(self, ost_idx, file_path):
-        """Throws subprocess.CalledProcessError on error in subprocess.check_output"""
+        """Throws subprocess.CalledProcessError on error in subprocess.run"""
 
         logging.debug("Setting stripe for file: %s - OST: %s", file_path, ost_idx)
 
         args = [self.lfs_bin, 'setstripe', '-i', ost_idx, file_path]
 
-        # TODO Use subprocess.run() with Python3.5
-        subprocess.check_output(args, stderr=subprocess.STDOUT).decode('UTF-8')
+        # List form execs lfs directly without a shell; the output is only
+        # of interest on failure, where it rides along in the exception.
+        subprocess.run(args, check=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
 
     def stripe_info(self, filename) -> StripeInfo:
         """
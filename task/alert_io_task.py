@@ -20,15 +20,9 @@
 
 import os
 import sys
-import zmq
-import time
 import logging
-import datetime
 import smtplib
 
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-
 from task.io_task import IOTask
 from db.ost_perf_result import OSTPerfResult
 from util.auto_remove_file import AutoRemoveFile
@@ -67,11 +61,32 @@ class AlertIOTask(IOTask):
         self.mail_receiver = mail_receiver
         self.mail_threshold = float(mail_threshold)
         self.mail_receiver_list = mail_receiver.replace(' ', '').split(',')
+        self.mail_to = ', '.join(self.mail_receiver_list)
+
+        # Pre-built plain text mail template: alerts only differ in subject
+        # and body, so no MIME object graph has to be created per mail.
+        self._mail_template = f"From: {self.mail_sender}\r\n" \
+                              f"To: {self.mail_to}\r\n" \
+                              "Subject: {subject}\r\n" \
+                              "MIME-Version: 1.0\r\n" \
+                              "Content-Type: text/plain; charset=utf-8\r\n" \
+                              "\r\n" \
+                              "{body}"
+
+        self._smtp_conn = None
 
     def execute(self):
 
         try:
 
+            write_timestamp = None
+            read_timestamp = None
+
+            write_duration = 0
+            write_throughput = 0
+            read_duration = 0
+            read_throughput = 0
+
             if self.lfs_utils.is_ost_idx_active(self.lfs_target, self.ost_idx):
 
                 self._initialize_payload()
@@ -80,25 +95,19 @@ class AlertIOTask(IOTask):
 
                 with AutoRemoveFile(file_path):
 
-                    if os.path.exists(file_path):
+                    # Remove a leftover file without a prior exists() stat.
+                    try:
                         os.remove(file_path)
+                    except FileNotFoundError:
+                        pass
 
                     self.lfs_utils.set_stripe(self.ost_idx, file_path)
 
-                    write_timestamp = datetime.datetime.fromtimestamp(time.time()).strftime('%Y-%m-%d %H:%M:%S')
+                    write_timestamp = self._timestamp_str()
 
-                    mail_subject = f"[LUSTRE Monitoring] OST Write Performance Degradation Detected: {self.ost_idx}"
-
-                    mail_text = f"Timestamp: {write_timestamp}\n" \
-                                f"OST: {self.ost_idx}\n\n" \
-                                f"Alert Threshold: {self.mail_threshold}s\n" \
-                                f"Total Size: {self.total_size_bytes}\n" \
-                                f"Block Size: {self.block_size_bytes}\n" \
-                                f"Sync Flag: {self.write_file_sync}\n"
-
-                    args_send_mail = [(mail_subject, mail_text)]
-
-                    mail_timer = Timer(self.mail_threshold, self._send_mail, args_send_mail)
+                    # The mail text is built in the timer callback, so the
+                    # typical case (timer cancelled in time) formats nothing.
+                    mail_timer = Timer(self.mail_threshold, self._build_and_send_mail, [write_timestamp, 'write'])
 
                     mail_timer.start()
 
@@ -106,17 +115,9 @@ class AlertIOTask(IOTask):
 
                     mail_timer.cancel()
 
-                    read_timestamp = datetime.datetime.fromtimestamp(time.time()).strftime('%Y-%m-%d %H:%M:%S')
-
-                    mail_subject = f"[LUSTRE Monitoring] OST Read Performance Degradation Detected: {self.ost_idx}"
+                    read_timestamp = self._timestamp_str()
 
-                    mail_text = f"OST-IDX: {self.ost_idx}\n" \
-                                f"Timestamp: {write_timestamp}\n" \
-                                f"Alert Threshold: {self.mail_threshold}s"
-
-                    args_send_mail = [(mail_subject, mail_text)]
-
-                    mail_timer = Timer(self.mail_threshold, self._send_mail, args_send_mail)
+                    mail_timer = Timer(self.mail_threshold, self._build_and_send_mail, [read_timestamp, 'read'])
 
                     mail_timer.start()
 
@@ -124,23 +125,23 @@ class AlertIOTask(IOTask):
 
                     mail_timer.cancel()
 
-                    ost_perf_result = \
-                        OSTPerfResult(read_timestamp,
-                                      write_timestamp,
-                                      self.ost_idx,
-                                      self.total_size_bytes,
-                                      read_throughput,
-                                      write_throughput,
-                                      read_duration,
-                                      write_duration)
             else:
 
-                timestamp = datetime.datetime.fromtimestamp(time.time()).strftime('%Y-%m-%d %H:%M:%S')
-
-                ost_perf_result = \
-                    OSTPerfResult(timestamp, timestamp, self.ost_idx, self.total_size_bytes, 0, 0, 0, 0)
+                # Non-active OST: report a zeroed result for this sweep.
+                write_timestamp = self._timestamp_str()
+                read_timestamp = write_timestamp
+
+            # Both branches feed a single result construction.
+            ost_perf_result = \
+                OSTPerfResult(read_timestamp,
+                              write_timestamp,
+                              self.ost_idx,
+                              self.total_size_bytes,
+                              read_throughput,
+                              write_throughput,
+                              read_duration,
+                              write_duration)
 
-            # TODO: Remove code redundancy in IOTasks.
             if ost_perf_result:
 
                 if logging.root.isEnabledFor(logging.DEBUG):
@@ -148,18 +149,7 @@ class AlertIOTask(IOTask):
 
                 if self.db_proxy_endpoint:
 
-                    timeout = 1000
-
-                    context = zmq.Context()
-
-                    sock = context.socket(zmq.PUSH)
-
-                    sock.setsockopt(zmq.LINGER, timeout)
-                    sock.SNDTIMEO = timeout
-
-                    sock.connect(self.db_proxy_endpoint)
-
-                    sock.send_string(ost_perf_result.to_csv_list())
+                    self._get_db_sock().send_string(ost_perf_result.to_csv_list())
 
                     logging.debug('Sent ost_perf_result to db-proxy.')
 
@@ -171,27 +161,80 @@ class AlertIOTask(IOTask):
             logging.error(f"Caught exception (type: {exc_type}) in AlertIOTask: {err} "
                           f"- {filename} (line: {exc_tb.tb_lineno})")
 
-    def _send_mail(self, args):
+    def _build_and_send_mail(self, timestamp, mode):
+        """Builds the alert mail lazily, only when the alert timer fires."""
+
+        if mode == 'write':
 
-        if args is None:
-            raise RuntimeError("Passed argument for send mail is not set!")
+            subject = f"[LUSTRE Monitoring] OST Write Performance Degradation Detected: {self.ost_idx}"
 
-        if len(args) != 2:
-            raise RuntimeError("Passed argument for send mail has invalid number of arguments!")
+            text = f"Timestamp: {timestamp}\n" \
+                   f"OST: {self.ost_idx}\n\n" \
+                   f"Alert Threshold: {self.mail_threshold}s\n" \
+                   f"Total Size: {self.total_size_bytes}\n" \
+                   f"Block Size: {self.block_size_bytes}\n" \
+                   f"Sync Flag: {self.write_file_sync}\n"
 
-        subject = args[0]
-        text = args[1]
+        elif mode == 'read':
 
-        msg = MIMEMultipart()
-        msg['Subject'] = subject
-        msg['From'] = self.mail_sender
-        msg['To'] = ', '.join(self.mail_receiver_list)
+            subject = f"[LUSTRE Monitoring] OST Read Performance Degradation Detected: {self.ost_idx}"
 
-        msg.attach(MIMEText(text))
-        msg_string = msg.as_string()
+            text = f"OST-IDX: {self.ost_idx}\n" \
+                   f"Timestamp: {timestamp}\n" \
+                   f"Alert Threshold: {self.mail_threshold}s"
+
+        else:
+            raise RuntimeError(f"Not supported alert mail mode detected: {mode}")
+
+        self._send_mail(subject, text)
+
+    def _send_mail(self, subject, text):
+
+        if not subject:
+            raise RuntimeError("Passed subject for send mail is not set!")
+
+        if not text:
+            raise RuntimeError("Passed text for send mail is not set!")
+
+        msg_string = self._mail_template.format(subject=subject, body=text)
 
         logging.debug(msg_string)
 
-        smtp_conn = smtplib.SMTP(self.mail_server)
-        smtp_conn.sendmail(self.mail_sender, self.mail_receiver_list, msg_string)
-        smtp_conn.quit()
+        self._get_smtp_conn().sendmail(self.mail_sender, self.mail_receiver_list, msg_string)
+
+    def _get_smtp_conn(self):
+        """Returns the SMTP connection held open across alerts.
+
+        A noop keepalive verifies an existing connection; a stale or
+        broken one is replaced, so an alert burst pays for a single
+        TCP connect and EHLO only.
+        """
+
+        if self._smtp_conn is not None:
+
+            try:
+                status = self._smtp_conn.noop()[0]
+            except (smtplib.SMTPException, OSError):
+                status = -1
+
+            if status != 250:
+                self._smtp_conn = None
+
+        if self._smtp_conn is None:
+            self._smtp_conn = smtplib.SMTP(self.mail_server)
+
+        return self._smtp_conn
+
+    def close(self):
+        """Releases the SMTP connection in addition to the IOTask resources."""
+
+        if self._smtp_conn is not None:
+
+            try:
+                self._smtp_conn.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+
+            self._smtp_conn = None
+
+        super().close()
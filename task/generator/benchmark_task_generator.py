@@ -24,7 +24,6 @@ import sys
 import os
 
 from conf.config_value_error import ConfigValueOutOfRangeError
-from ctrl.critical_section import CriticalSection
 from task.benchmark_task import BenchmarkTask
 from task.generator.base_task_generator import BaseTaskGenerator
 
@@ -63,7 +62,10 @@ class BenchmarkTaskGenerator(BaseTaskGenerator):
             len_task_list = len(task_list)
             completed_tasks = 0
 
-            with CriticalSection(self._task_queue.lock):
+            # The lock is its own context manager; entering it directly
+            # skips the CriticalSection wrapper allocation and its
+            # Python-level __enter__/__exit__ dispatch.
+            with self._task_queue.lock:
 
                 if not self._task_queue.is_empty():
                     self._task_queue.clear()
@@ -25,7 +25,6 @@ import sys
 import os
 
 from clush.RangeSet import RangeSet
-from ctrl.critical_section import CriticalSection
 from lfs.lfs_utils import LFSUtils
 from task.xml.task_xml_reader import TaskXmlReader
 from task.task_factory import TaskFactory
@@ -77,7 +76,10 @@ class LustreMonitoringTaskGenerator(BaseTaskGenerator):
 
                 task_list = self._create_task_list(ost_idx_list)
 
-                with CriticalSection(self._task_queue.lock):
+                # The lock is its own context manager; entering it directly
+                # skips the CriticalSection wrapper allocation and its
+                # Python-level __enter__/__exit__ dispatch.
+                with self._task_queue.lock:
 
                     if not self._task_queue.is_empty():
                         self._task_queue.clear()
@@ -23,7 +23,6 @@ import sys
 import zmq
 import time
 import logging
-import datetime
 
 from task.base_task import BaseTask
 from db.ost_perf_result import OSTPerfResult
@@ -74,6 +73,9 @@ class IOTask(BaseTask):
         else:
             self.db_proxy_endpoint = None
 
+        self._db_context = None
+        self._db_sock = None
+
         if not (self.write_file_sync == 'on' or self.write_file_sync == 'off'):
             raise RuntimeError("Value for parameter write_file_sync must be either 'on' or 'off'!")
 
@@ -91,15 +93,18 @@ class IOTask(BaseTask):
 
                 with AutoRemoveFile(file_path):
 
-                    if os.path.exists(file_path):
+                    # Remove a leftover file without a prior exists() stat.
+                    try:
                         os.remove(file_path)
+                    except FileNotFoundError:
+                        pass
 
                     self.lfs_utils.set_stripe(self.ost_idx, file_path)
 
-                    write_timestamp = datetime.datetime.fromtimestamp(time.time()).strftime('%Y-%m-%d %H:%M:%S')
+                    write_timestamp = self._timestamp_str()
                     write_duration, write_throughput = self._write_file(file_path)
 
-                    read_timestamp = datetime.datetime.fromtimestamp(time.time()).strftime('%Y-%m-%d %H:%M:%S')
+                    read_timestamp = self._timestamp_str()
                     read_duration, read_throughput = self._read_file(file_path)
 
                     ost_perf_result = \
@@ -115,7 +120,7 @@ class IOTask(BaseTask):
 
                 logging.debug("Found non-active OST: %s", self.ost_idx)
 
-                timestamp = datetime.datetime.fromtimestamp(time.time()).strftime('%Y-%m-%d %H:%M:%S')
+                timestamp = self._timestamp_str()
 
                 ost_perf_result = \
                     OSTPerfResult(timestamp, timestamp, self.ost_idx, self.total_size_bytes, 0, 0, 0, 0)
@@ -127,18 +132,7 @@ class IOTask(BaseTask):
 
                 if self.db_proxy_endpoint:
 
-                    timeout = 1000
-
-                    context = zmq.Context()
-
-                    sock = context.socket(zmq.PUSH)
-
-                    sock.setsockopt(zmq.LINGER, timeout)
-                    sock.SNDTIMEO = timeout
-
-                    sock.connect(self.db_proxy_endpoint)
-
-                    sock.send_string(ost_perf_result.to_csv_list())
+                    self._get_db_sock().send_string(ost_perf_result.to_csv_list())
 
                     logging.debug('Sent ost_perf_result to db-proxy.')
 
@@ -150,6 +144,55 @@ class IOTask(BaseTask):
             logging.error(f"Caught exception (type: {exc_type}) in IOTask: {err}"
                           f" - {filename} (line: {exc_tb.tb_lineno})")
 
+    def _get_db_sock(self):
+        """Returns the PUSH socket to the database proxy.
+
+        The context and socket are created lazily on first use and reused
+        across executes, so repeated runs pay for a single connect only.
+        """
+
+        if self._db_sock is None:
+
+            timeout = 1000
+
+            self._db_context = zmq.Context()
+
+            sock = self._db_context.socket(zmq.PUSH)
+
+            sock.setsockopt(zmq.LINGER, timeout)
+            sock.SNDTIMEO = timeout
+
+            sock.connect(self.db_proxy_endpoint)
+
+            self._db_sock = sock
+
+        return self._db_sock
+
+    def close(self):
+        """Releases the database proxy socket and context, if created."""
+
+        if self._db_sock is not None:
+
+            self._db_sock.close()
+            self._db_sock = None
+
+        if self._db_context is not None:
+
+            self._db_context.term()
+            self._db_context = None
+
+    def __del__(self):
+        self.close()
+
+    @staticmethod
+    def _timestamp_str():
+        """Returns the current local time formatted for OSTPerfResult.
+
+        time.strftime formats the broken-down time directly and skips
+        building an intermediate datetime object.
+        """
+        return time.strftime('%Y-%m-%d %H:%M:%S')
+
     def _initialize_payload(self):
 
         # No random numbers are used, since no compression is used in Lustre FS directly.
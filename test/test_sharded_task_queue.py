@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2021 Gabriele Iannetti <g.iannetti@gsi.de>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+import logging
+import multiprocessing
+import time
+
+from ctrl.sharded_task_queue import ShardedTaskQueue
+from ctrl.spsc_ring_buffer import SPSCRingBuffer
+
+
+ITEM_COUNT = 400
+CONSUMER_COUNT = 4
+
+
+def consumer_func(consumer_name, task_queue, result_ring):
+
+    logging.info("Started consumer: %s", consumer_name)
+
+    consumed = 0
+    misses = 0
+
+    # Pop from the home shard first and steal from the neighbours;
+    # a run of empty polls across all shards ends the consumer.
+    while misses < 100:
+
+        item = task_queue.pop_nowait_for(consumer_name)
+
+        if item is None:
+
+            misses += 1
+            time.sleep(0.001)
+            continue
+
+        misses = 0
+        result_ring.push(item)
+        consumed += 1
+
+    logging.info("Consumer[%s] finished - consumed items: %i", consumer_name, consumed)
+
+
+def check_fill_and_clear():
+
+    task_queue = ShardedTaskQueue()
+
+    task_list = [f"ITEM_{i}" for i in range(ITEM_COUNT)]
+
+    with task_queue.lock:
+
+        if not task_queue.is_empty():
+            task_queue.clear()
+
+        task_queue.fill(task_list)
+
+    if task_queue.is_empty():
+        raise RuntimeError("Sharded task queue empty after fill!")
+
+    task_queue.clear()
+
+    # clear() on a multiprocessing.Queue may leave just-cleared items
+    # visible for a moment; poll until the queue settles.
+    for _ in range(100):
+
+        if task_queue.is_empty():
+            break
+
+        time.sleep(0.01)
+
+    if not task_queue.is_empty():
+        raise RuntimeError("Sharded task queue not empty after clear!")
+
+    logging.info("Fill and clear round trip done for %i items", ITEM_COUNT)
+
+
+def check_multi_consumer():
+
+    # A fresh queue: clear() on a multiprocessing.Queue may leave items
+    # buffered in its feeder thread, which would leak into this check.
+    task_queue = ShardedTaskQueue()
+
+    # One SPSC ring per consumer reports the consumed items back.
+    result_rings = [SPSCRingBuffer(capacity=2 * ITEM_COUNT) for _ in range(CONSUMER_COUNT)]
+
+    procs = list()
+
+    for cid in range(CONSUMER_COUNT):
+
+        consumer_name = f"CONSUMER_{cid}"
+
+        proc = multiprocessing.Process(target=consumer_func,
+                                       args=(consumer_name, task_queue, result_rings[cid]))
+        proc.start()
+        procs.append(proc)
+
+    # Pushes spread round-robin across the shards.
+    for i in range(ITEM_COUNT):
+        task_queue.push(f"ITEM_{i}")
+
+    for proc in procs:
+        proc.join()
+
+    consumed_items = list()
+
+    for result_ring in result_rings:
+
+        while True:
+
+            item = result_ring.pop_nowait()
+
+            if item is None:
+                break
+
+            consumed_items.append(item)
+
+    expected_items = {f"ITEM_{i}" for i in range(ITEM_COUNT)}
+
+    if len(consumed_items) != ITEM_COUNT:
+        raise RuntimeError(f"Consumed item count mismatch: {len(consumed_items)} - expected: {ITEM_COUNT}")
+
+    if set(consumed_items) != expected_items:
+        raise RuntimeError("Consumed items do not match the pushed items!")
+
+    if not task_queue.is_empty():
+        raise RuntimeError("Sharded task queue not empty after consuming all items!")
+
+    logging.info("%i items consumed exactly once by %i consumers across the shards",
+                 ITEM_COUNT, CONSUMER_COUNT)
+
+
+def main():
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s: %(message)s")
+
+    logging.info("START")
+
+    check_fill_and_clear()
+    check_multi_consumer()
+
+    logging.info("END")
+
+
+if __name__ == '__main__':
+    main()
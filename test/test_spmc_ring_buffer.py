@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2021 Gabriele Iannetti <g.iannetti@gsi.de>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+import logging
+import multiprocessing
+
+from ctrl.spmc_ring_buffer import SPMCRingBuffer
+from ctrl.spsc_ring_buffer import SPSCRingBuffer
+
+
+ITEM_COUNT = 1200
+CONSUMER_COUNT = 3
+POISEN_PILL = "POISEN_PILL"
+
+
+def consumer_func(cid, ring, result_ring):
+
+    logging.info("Started consumer: %i", cid)
+
+    consumed = 0
+
+    while True:
+
+        item = ring.pop()
+
+        if item == POISEN_PILL:
+            break
+
+        result_ring.push(item)
+        consumed += 1
+
+    logging.info("Consumer[%i] finished - consumed items: %i", cid, consumed)
+
+
+def check_multi_consumer():
+
+    # Capacity below the item count, so the producer also blocks on a
+    # full ring while the consumers drain it concurrently.
+    ring = SPMCRingBuffer(capacity=256)
+
+    # One SPSC ring per consumer reports the consumed items back.
+    result_rings = [SPSCRingBuffer(capacity=2 * ITEM_COUNT) for _ in range(CONSUMER_COUNT)]
+
+    procs = list()
+
+    for cid in range(CONSUMER_COUNT):
+
+        proc = multiprocessing.Process(target=consumer_func, args=(cid, ring, result_rings[cid]))
+        proc.start()
+        procs.append(proc)
+
+    for i in range(ITEM_COUNT):
+        ring.push(f"ITEM_{i}")
+
+    for _ in range(CONSUMER_COUNT):
+        ring.push(POISEN_PILL)
+
+    for proc in procs:
+        proc.join()
+
+    consumed_items = list()
+
+    for result_ring in result_rings:
+
+        while True:
+
+            item = result_ring.pop_nowait()
+
+            if item is None:
+                break
+
+            consumed_items.append(item)
+
+    expected_items = {f"ITEM_{i}" for i in range(ITEM_COUNT)}
+
+    if len(consumed_items) != ITEM_COUNT:
+        raise RuntimeError(f"Consumed item count mismatch: {len(consumed_items)} - expected: {ITEM_COUNT}")
+
+    if set(consumed_items) != expected_items:
+        raise RuntimeError("Consumed items do not match the pushed items!")
+
+    if not ring.is_empty():
+        raise RuntimeError("Ring not empty after consuming all items!")
+
+    logging.info("%i items consumed exactly once by %i consumers", ITEM_COUNT, CONSUMER_COUNT)
+
+
+def check_pop_batch():
+
+    ring = SPMCRingBuffer(capacity=16)
+
+    for i in range(5):
+        ring.push(f"ITEM_{i}")
+
+    # Blocking for the first item, then draining without blocking.
+    items = ring.pop_batch(3)
+
+    if items != ["ITEM_0", "ITEM_1", "ITEM_2"]:
+        raise RuntimeError(f"Unexpected batch content: {items}")
+
+    items = ring.pop_batch(8)
+
+    if items != ["ITEM_3", "ITEM_4"]:
+        raise RuntimeError(f"Unexpected partial batch content: {items}")
+
+    logging.info("Batch pop drains queued items in order")
+
+
+def main():
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s: %(message)s")
+
+    logging.info("START")
+
+    check_multi_consumer()
+    check_pop_batch()
+
+    logging.info("END")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2021 Gabriele Iannetti <g.iannetti@gsi.de>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+import logging
+import multiprocessing
+
+from ctrl.spsc_ring_buffer import SPSCRingBuffer
+
+
+ITEM_COUNT = 3000
+
+
+def producer_func(ring):
+
+    logging.info("Started producer")
+
+    # More items than the ring capacity, so the producer also
+    # blocks on a full ring and resumes once slots free up.
+    for i in range(ITEM_COUNT):
+        ring.push(f"ITEM_{i}")
+
+    logging.info("Producer finished")
+
+
+def check_cross_process_fifo():
+
+    ring = SPSCRingBuffer(capacity=256)
+
+    proc = multiprocessing.Process(target=producer_func, args=(ring,))
+    proc.start()
+
+    popped = 0
+
+    while popped < ITEM_COUNT:
+
+        item = ring.pop_nowait()
+
+        if item is None:
+            continue
+
+        if item != f"ITEM_{popped}":
+            raise RuntimeError(f"FIFO order violated: {item} - expected: ITEM_{popped}")
+
+        popped += 1
+
+    proc.join()
+
+    if not ring.is_empty():
+        raise RuntimeError("Ring not empty after popping all items!")
+
+    logging.info("Cross-process FIFO order kept for %i items", popped)
+
+
+def check_full_ring():
+
+    ring = SPSCRingBuffer(capacity=2)
+
+    if not (ring.try_push("A") and ring.try_push("B")):
+        raise RuntimeError("Push to non-full ring failed!")
+
+    if ring.try_push("C"):
+        raise RuntimeError("Push to full ring succeeded!")
+
+    if ring.pop_nowait() != "A":
+        raise RuntimeError("Pop from full ring failed!")
+
+    if not ring.try_push("C"):
+        raise RuntimeError("Push after pop from full ring failed!")
+
+    logging.info("Full ring rejects pushes and recovers after a pop")
+
+
+def check_oversized_item():
+
+    ring = SPSCRingBuffer(capacity=2, slot_size=8)
+
+    try:
+
+        ring.try_push("X" * 9)
+        raise RuntimeError("Oversized push did not raise!")
+
+    except RuntimeError as err:
+
+        if "slot size" not in str(err):
+            raise
+
+        logging.info("Oversized item rejected: %s", err)
+
+
+def main():
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s: %(message)s")
+
+    logging.info("START")
+
+    check_cross_process_fifo()
+    check_full_ring()
+    check_oversized_item()
+
+    logging.info("END")
+
+
+if __name__ == '__main__':
+    main()
@@ -31,5 +31,7 @@ class AutoRemoveFile:
 
     def __exit__(self, exc_type, exc_value, traceback):
 
-        if os.path.exists(self.file_path):
+        try:
             os.remove(self.file_path)
+        except FileNotFoundError:
+            pass
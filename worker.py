@@ -20,15 +20,37 @@
 
 import multiprocessing
 import logging
-import signal
 import ctypes
 import time
+import zlib
 import sys
 import abc
 import os
 
 
-from ctrl.critical_section import CriticalSection
+from msg.task_assign import TaskAssign
+
+
+# Cached module logger: the logging.debug/error module functions resolve
+# the root logger on every call, while a cached logger dispatches directly
+# and still propagates to the root handlers.
+_log = logging.getLogger(__name__)
+
+
+def _log_task_exc(name, phase, err):
+    """Logs an exception caught in a worker.
+
+    Kept at module level so the run loop carries no formatting bytecode;
+    traceback introspection and message formatting only happen when an
+    exception was actually raised and error logging is enabled.
+    """
+
+    if _log.isEnabledFor(logging.ERROR):
+
+        exc_type, _, exc_tb = sys.exc_info()
+        filename = exc_tb.tb_frame.f_code.co_filename.rpartition('/')[2]
+        _log.error("Caught exception (type: %s) in worker[%s] during %s: %s - %s (line: %s)",
+                   exc_type, name, phase, err, filename, exc_tb.tb_lineno)
 
 
 class WorkerState:
@@ -52,130 +74,230 @@ class WorkerState:
             raise RuntimeError(f"Not supported worker state detected: {state}")
 
 
+class _WorkerStateSlot(ctypes.Structure):
+    """Backing storage of one WorkerStateTableItem.
+
+    The packed state word is padded to 128 bytes, so adjacent slots of a
+    state table array never share a cache line (two lines also cover the
+    adjacent-line prefetcher) and worker processes writing their state
+    words concurrently cause no coherence traffic between cores.
+    """
+
+    _fields_ = [('packed', ctypes.c_uint64),
+                ('padding', ctypes.c_char * 120)]
+
+
 class WorkerStateTableItem:
 
-    def __init__(self):
+    def __init__(self, slot=None):
+
+        # State, tid handle and timestamp are packed into one 64-bit word
+        # as ((timestamp << 36) | (tid_handle << 4) | state). The timestamp
+        # is the number of seconds since this item was created, taken from
+        # the monotonic clock and truncated to 20 bits (wraps after about
+        # 12 days); the tid handle is the CRC32 of the tid in execution
+        # (0 = idle). The worker is the only writer of its item, so a state
+        # transition is published with a single word store and needs no
+        # lock, while a reader decodes a consistent snapshot of all three
+        # fields from one load.
+        if slot is None:
+            slot = multiprocessing.RawValue(_WorkerStateSlot)
+
+        self._slot = slot
+
+        self._creation_time = time.monotonic()
+
+    @classmethod
+    def create_table_items(cls, count):
+        """Creates count items backed by one contiguous shared memory array.
+
+        One cache-line padded slot per item keeps the table compact for a
+        monitor scanning it while avoiding false sharing between the
+        worker processes writing their state words.
+        """
 
-        # # RETURNS STDOUT: self._state = "TEXT" + str(NUMBER)
-        # # RETURNS BAD VALUE: self._timestamp.value = 1234567890.99
-        # self._state = multiprocessing.RawValue(ctypes.c_char_p)
-        # self._tid = multiprocessing.RawValue(ctypes.c_char_p)
-        # self._timestamp = multiprocessing.RawValue(ctypes.c_float)
+        slots = multiprocessing.RawArray(_WorkerStateSlot, count)
 
-        self._state = multiprocessing.RawValue(ctypes.c_int, WorkerState.NOT_READY)
-        self._tid = multiprocessing.RawArray('c', 64)
-        self._timestamp = multiprocessing.RawValue(ctypes.c_uint, 0)
+        return [cls(slot) for slot in slots]
 
     # TODO: Use Properties... see OSTInfo
     @property
     def get_state(self):
-        return self._state.value
+        return self._slot.packed & 0xF
 
     @property
-    def get_tid(self):
-        return self._tid.value.decode()
+    def get_tid_handle(self):
+        return (self._slot.packed >> 4) & 0xFFFFFFFF
 
     @property
     def get_timestamp(self):
-        return self._timestamp.value
+        """Returns the seconds since item creation at the last state transition."""
+        return self._slot.packed >> 36
+
+    def make_timestamp(self):
+        """Returns the current 20-bit seconds-since-creation timestamp."""
+        return int(time.monotonic() - self._creation_time) & 0xFFFFF
 
-    def set_state(self, state):
-        self._state.value = state
+    def set_state_tid_timestamp(self, state, tid_handle, timestamp):
+        """Publishes state, tid handle and timestamp with one atomic word store."""
+        self._slot.packed = (timestamp << 36) | (tid_handle << 4) | state
 
-    def set_tid(self, task_name):
-        self._tid.value = task_name.encode()
 
-    def set_timestamp(self, timestamp):
-        self._timestamp.value = timestamp
+# Workers always fork: the child inherits the loaded modules and the shared
+# state structures as-is, so spawning a worker costs no re-import and no
+# pickling of its state, independent of the platform default start method.
+_fork_context = multiprocessing.get_context('fork')
 
 
-class Worker(multiprocessing.Process):
+class Worker(_fork_context.Process):
 
     def __init__(self,
                  name,
                  worker_state_table_item,
-                 lock_worker_state_table,
                  task_queue,
-                 result_queue, cond_result_queue):
+                 result_queue, result_wakeup_fd,
+                 run_flag,
+                 batch_size=8):
 
         super().__init__()
 
         self.name = name
 
+        # The worker owns its state table item: it is the only writer and
+        # publishes each transition with one atomic word store, so no lock
+        # guards the table. Readers tolerate a stale snapshot within one
+        # polling round.
         self.worker_state_table_item = worker_state_table_item
-        self.lock_worker_state_table = lock_worker_state_table
 
         self.task_queue = task_queue
 
         self.result_queue = result_queue
-        self.cond_result_queue = cond_result_queue
-
-        self.run_flag = False
-
-    def start(self):
+        self.result_wakeup_fd = result_wakeup_fd
 
-        self.run_flag = True
+        # Number of tasks popped per queue access; already queued tasks are
+        # drained in one go and their results pushed back in one batch.
+        self.batch_size = batch_size
 
-        super().start()
+        # Shared run flag for all worker of a pool; checking it is a plain
+        # word load and one store in the parent stops every worker loop.
+        # The flag is initialized to 1 by its creator, so start() needs no
+        # override: re-arming it here would depend on the parent's write
+        # being visible in the child, which only fork guarantees.
+        self.run_flag = run_flag
 
     def run(self):
 
         try:
 
-            signal.signal(signal.SIGUSR1, self.signal_handler_shutdown)
-            signal.siginterrupt(signal.SIGUSR1, True)
+            _log.debug("Started Worker: %s", self.name)
 
-            logging.debug("Started Worker: %s", self.name)
+            # The hot loop stays pure Python since the tree ships no
+            # compiled extensions and no build step; binding every
+            # per-iteration name once removes the attribute and global
+            # lookups the interpreter would otherwise dispatch per task.
+            state_table_item = self.worker_state_table_item
+            publish_state = state_table_item.set_state_tid_timestamp
+            make_timestamp = state_table_item.make_timestamp
+            pop_batch = self.task_queue.pop_batch
+            pop_nowait = self.task_queue.pop_nowait
+            batch_size = self.batch_size
+            result_ring_is_empty = self.result_queue.is_empty
+            push_results = self.result_queue.push_batch
+            result_wakeup_fd = self.result_wakeup_fd
+            run_flag = self.run_flag
+            state_ready = WorkerState.READY
+            state_executing = WorkerState.EXECUTING
+            crc32 = zlib.crc32
+            write = os.write
 
-            with CriticalSection(self.lock_worker_state_table):
+            # State transitions are single-writer and published with one
+            # atomic store each, so no state table lock is taken here.
+            publish_state(state_ready, 0, make_timestamp())
 
-                self.worker_state_table_item.set_state(WorkerState.READY)
-                self.worker_state_table_item.set_timestamp(int(time.time()))
+            # Descriptor fetched one iteration ahead, so a loop turn starts
+            # on a warm local instead of re-entering the blocking pop.
+            lookahead_descriptor = None
 
-            while self.run_flag:
+            while run_flag.value:
 
-                task = self.task_queue.pop()
+                if lookahead_descriptor is None:
+                    task_descriptors = pop_batch(batch_size)
+                else:
 
-                with CriticalSection(self.lock_worker_state_table):
+                    task_descriptors = [lookahead_descriptor]
+                    lookahead_descriptor = None
 
-                    self.worker_state_table_item.set_state(WorkerState.EXECUTING)
-                    self.worker_state_table_item.set_tid(task.tid)
-                    self.worker_state_table_item.set_timestamp(int(time.time()))
+                    while len(task_descriptors) < batch_size:
 
-                try:
+                        task_descriptor = pop_nowait()
 
-                    task.execute()
+                        if task_descriptor is None:
+                            break
 
-                except Exception as err:
+                        task_descriptors.append(task_descriptor)
+
+                finished_tids = []
+
+                for task_descriptor in task_descriptors:
+
+                    # Descriptors are serialized TASK_ASSIGN strings straight
+                    # from shared memory; deserialize into the task object.
+                    task = TaskAssign(task_descriptor).to_task()
+
+                    publish_state(state_executing, crc32(task.tid.encode()), make_timestamp())
+
+                    try:
+
+                        task.execute()
+
+                    except Exception as err:
+                        _log_task_exc(self.name, 'task execute', err)
 
-                    exc_type, _, exc_tb = sys.exc_info()
-                    filename = os.path.split(exc_tb.tb_frame.f_code.co_filename)[1]
-                    logging.error(f"Caught exception (type: {exc_type}) in worker[{self.name}] "
-                                  f"during task execute: {err} - {filename} (line: {exc_tb.tb_lineno})")
+                    finished_tids.append(task.tid)
 
-                with CriticalSection(self.cond_result_queue):
+                # Prefetch the next descriptor before publishing this
+                # batch's results; queued work then overlaps the result
+                # ring and wakeup writes below.
+                lookahead_descriptor = pop_nowait()
 
-                    self.result_queue.push(task.tid)
-                    self.cond_result_queue.notify()
+                # The worker is the single producer of its result ring, so
+                # the empty probe and the push need no lock. Wake the
+                # collector only on the empty-to-non-empty transition with
+                # one pipe write: while the collector is still draining,
+                # further wakeups are redundant, and a lost race is covered
+                # by the collector's timed select.
+                ring_was_empty = result_ring_is_empty()
 
-                with CriticalSection(self.lock_worker_state_table):
+                push_results(finished_tids)
 
-                    self.worker_state_table_item.set_state(WorkerState.READY)
-                    self.worker_state_table_item.set_tid('')
-                    self.worker_state_table_item.set_timestamp(int(time.time()))
+                if ring_was_empty:
 
-            logging.debug("Exiting worker: %s", self.name)
+                    try:
+                        write(result_wakeup_fd, b'\0')
+                    except BlockingIOError:
+                        # A full pipe already holds pending wakeups.
+                        pass
+
+                publish_state(state_ready, 0, make_timestamp())
+
+            # A descriptor prefetched in the last iteration must not be
+            # lost on shutdown: finish it before exiting.
+            if lookahead_descriptor is not None:
+
+                task = TaskAssign(lookahead_descriptor).to_task()
+
+                try:
+                    task.execute()
+                except Exception as err:
+                    _log_task_exc(self.name, 'task execute', err)
+
+                push_results([task.tid])
+
+            _log.debug("Exiting worker: %s", self.name)
 
             os._exit(0)
 
         except Exception as err:
 
-            exc_type, _, exc_tb = sys.exc_info()
-            filename = os.path.split(exc_tb.tb_frame.f_code.co_filename)[1]
-            logging.error(f"Caught exception (type: {exc_type}) in worker[{self.name}] during run loop: {err} "
-                          f"- {filename} (line: {exc_tb.tb_lineno})")
+            _log_task_exc(self.name, 'run loop', err)
             os._exit(1)
-
-    def signal_handler_shutdown(self, signal, frame):
-        # pylint: disable=unused-argument
-        self.run_flag = False